@@ -1,6 +1,15 @@
+import os
+
 import pytest
+from hypothesis import settings
+
 import test.util
 
+# The thorough 'ci' profile is the default. Set HYPOTHESIS_PROFILE=dev for a quicker run.
+settings.register_profile('dev', max_examples=25, deadline=None)
+settings.register_profile('ci', max_examples=200, deadline=None)
+settings.load_profile(os.getenv('HYPOTHESIS_PROFILE', 'ci'))
+
 
 @pytest.fixture(params=[True, False])
 def ibm_floating_point_impls(request):
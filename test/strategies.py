@@ -117,6 +117,24 @@ def ranges(draw,
     return range(start, stop, step)
 
 
+@composite
+def unsorted_lists(draw, max_size=None):
+    """A Hypothesis strategy to produce lists of integers which are not sorted.
+
+    An arbitrary list has an arbitrary item smaller than its predecessor inserted
+    at an arbitrary position, so every list produced is unsorted without any
+    examples being discarded.
+
+    Args:
+        max_size: The maximum size of the arbitrary list into which the
+            out-of-order item is inserted.
+    """
+    items = draw(lists(integers(), min_size=1, max_size=max_size))
+    k = draw(integers(min_value=1, max_value=len(items)))
+    items.insert(k, draw(integers(max_value=items[k - 1] - 1)))
+    return items
+
+
 Items2D = namedtuple('Items2D', ['i_range', 'j_range', 'items'])
 
 
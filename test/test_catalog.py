@@ -1,17 +1,92 @@
+import re
 from itertools import product, count
+from types import MappingProxyType
 
-from hypothesis import given, assume
-from hypothesis.strategies import (data, dictionaries, just,
-                                   integers, tuples, lists, sets)
+import pytest
+from hypothesis import given, assume, settings
+from hypothesis.strategies import (composite, data, dictionaries, just,
+                                   integers, one_of, tuples, lists)
 from pytest import raises
 
 from segpy.catalog import (CatalogBuilder, DictionaryCatalog, DictionaryCatalog2D, RegularConstantCatalog,
                            ConstantCatalog, RegularCatalog, LinearRegularCatalog, LastIndexVariesQuickestCatalog2D,
                            FirstIndexVariesQuickestCatalog2D)
-from segpy.sorted_frozen_set import SortedFrozenSet
-from segpy.util import first, last, is_sorted
+from segpy.util import first, last
 from test.predicates import check_balanced
-from test.strategies import ranges, items2d
+from test.strategies import ranges, items2d, unsorted_lists
+
+_INTS = integers()
+_INT_DICT = dictionaries(_INTS, _INTS)
+_BOUNDED_DICT = dictionaries(integers(min_value=0, max_value=100), integers(min_value=0, max_value=100))
+_RANGE = ranges(min_size=1, max_size=100, min_step_value=1)
+_NONZERO_STEP = one_of(integers(-100, -1), integers(1, 100))
+
+_REGULAR_CONSTANT_CATALOG_REPR = re.compile(
+    r'RegularConstantCatalog\(key_min=(-?\d+), key_max=(-?\d+), key_stride=(-?\d+), value=(-?\d+)\)')
+_REGULAR_CATALOG_REPR = re.compile(
+    r'RegularCatalog\(key_min=(-?\d+), key_max=(-?\d+), key_stride=(-?\d+), values=\[(\d+) items\]\)')
+
+_IRREGULAR_EXAMPLE = MappingProxyType({
+    1: 2,
+    2: 3,
+    3: 5,
+    5: 7,
+    8: 11,
+    13: 13,
+    21: 17,
+    34: 19,
+    55: 23,
+    89: 29,
+    144: 31,
+})
+
+_ROW_MAJOR_EXAMPLE = MappingProxyType({
+    (0, 4): 8,
+    (0, 5): 9,
+    (0, 6): 10,
+    (1, 4): 11,
+    (1, 5): 12,
+    (1, 6): 13,
+    (2, 4): 14,
+    (2, 5): 15,
+    (2, 6): 16
+})
+
+_COLUMN_MAJOR_EXAMPLE = MappingProxyType({
+    (11, 14): 5,
+    (13, 14): 10,
+    (15, 14): 15,
+    (11, 16): 20,
+    (13, 16): 25,
+    (15, 16): 30,
+    (11, 18): 35,
+    (13, 18): 40,
+    (15, 18): 45
+})
+
+
+def _capped_settings(max_examples):
+    """Settings which run at most max_examples, but never more than the active profile allows.
+
+    The active profile is read when this module is imported, so it relies on
+    conftest.py having already loaded the profile.
+    """
+    return settings(max_examples=min(settings().max_examples, max_examples))
+
+
+# Tests which build an item for every (i, j) pair run fewer examples.
+_QUADRATIC_SETTINGS = _capped_settings(50)
+
+# Tests which add items one at a time through the builder run fewer examples.
+_INCREMENTAL_BUILD_SETTINGS = _capped_settings(30)
+
+
+@composite
+def ranges_with_values(draw):
+    """A Hypothesis strategy to produce a (range, values) pair, where values is a list of the same length."""
+    r = draw(_RANGE)
+    values = draw(lists(_INTS, min_size=len(r), max_size=len(r)))
+    return r, values
 
 
 class TestCatalogBuilder:
@@ -34,74 +109,64 @@ class TestCatalogBuilder:
         with raises(ValueError):
             CatalogBuilder([(1, 2, 3)])
 
-    @given(lists(min_size=1, elements=tuples(integers(), integers())))
+    @given(lists(min_size=1, max_size=4, elements=tuples(integers(min_value=-1000, max_value=1000), integers())))
     def test_duplicate_items_returns_none(self, mapping):
         builder = CatalogBuilder(mapping + mapping)
         catalog = builder.create()
         assert catalog is None
 
-    @given(dictionaries(integers(), integers()))
+    @given(_INT_DICT)
     def test_arbitrary_mapping(self, mapping):
         builder = CatalogBuilder(mapping)
         catalog = builder.create()
-        shared_items = set(mapping.items()) & set(catalog.items())
-        assert len(shared_items) == len(mapping)
+        assert mapping.items() <= catalog.items()
 
     @given(dictionaries(integers(), just(42)))
     def test_constant_mapping(self, mapping):
         builder = CatalogBuilder(mapping)
         catalog = builder.create()
-        shared_items = set(mapping.items()) & set(catalog.items())
-        assert len(shared_items) == len(mapping)
+        assert mapping.items() <= catalog.items()
 
     @given(start=integers(),
            num=integers(0, 100),
-           step=integers(-100, 100),
+           step=_NONZERO_STEP,
            value=integers())
     def test_regular_constant_mapping(self, start, num, step, value):
-        assume(step != 0)
         mapping = {key: value for key in range(
             start, start + num * step, step)}
         builder = CatalogBuilder(mapping)
         catalog = builder.create()
-        shared_items = set(mapping.items()) & set(catalog.items())
-        assert len(shared_items) == len(mapping)
+        assert mapping.items() <= catalog.items()
 
     @given(start=integers(),
            num=integers(0, 100),
-           step=integers(-100, 100),
+           step=_NONZERO_STEP,
            values=data())
     def test_regular_mapping(self, start, num, step, values):
-        assume(step != 0)
         mapping = {key: values.draw(integers())
                    for key
                    in range(start, start + num * step, step)}
         builder = CatalogBuilder(mapping)
         catalog = builder.create()
-        shared_items = set(mapping.items()) & set(catalog.items())
-        assert len(shared_items) == len(mapping)
+        assert mapping.items() <= catalog.items()
 
     @given(num=integers(0, 100),
            key_start=integers(),
-           key_step=integers(-100, 100),
+           key_step=_NONZERO_STEP,
            value_start=integers(),
-           value_step=integers(-100, 100))
+           value_step=_NONZERO_STEP)
     def test_linear_regular_mapping(self, num, key_start, key_step, value_start, value_step):
-        assume(key_step != 0)
-        assume(value_step != 0)
         mapping = {key: value for key, value in zip(range(key_start, key_start + num * key_step, key_step),
                                                     range(value_start, value_start + num * value_step, value_step))}
         builder = CatalogBuilder(mapping)
         catalog = builder.create()
-        shared_items = set(mapping.items()) & set(catalog.items())
-        assert len(shared_items) == len(mapping)
+        assert mapping.items() <= catalog.items()
 
     @given(dictionaries(tuples(integers(), integers()), integers()))
     def test_arbitrary_mapping_2d(self, mapping):
         builder = CatalogBuilder(mapping)
         catalog = builder.create()
-        shared_items = set(mapping.items()) & set(catalog.items())
-        assert len(shared_items) == len(mapping)
+        assert mapping.items() <= catalog.items()
 
     @given(i_start=integers(0, 10),
            i_num=integers(1, 10),
@@ -110,77 +175,66 @@ class TestCatalogBuilder:
            j_num=integers(1, 10),
            j_step=just(1),
            c=integers(1, 10))
+    @_QUADRATIC_SETTINGS
     def test_linear_regular_mapping_2d(self, i_start, i_num, i_step, j_start, j_num, j_step, c):
         assume(i_step != 0)
         assume(j_step != 0)
 
-        def v(i, j):
-            return (i - i_start) * ((j_start + j_num * j_step) - j_start) + (j - j_start) + c
+        i_range = range(i_start, i_start + i_num * i_step, i_step)
+        j_range = range(j_start, j_start + j_num * j_step, j_step)
+        j_span = j_num * j_step
 
-        mapping = {(i, j): v(i, j)
-                   for i in range(i_start, i_start + i_num * i_step, i_step)
-                   for j in range(j_start, j_start + j_num * j_step, j_step)}
+        mapping = {(i, j): (i - i_start) * j_span + (j - j_start) + c
+                   for i in i_range
+                   for j in j_range}
 
         builder = CatalogBuilder(mapping)
         catalog = builder.create()
-        shared_items = set(mapping.items()) & set(catalog.items())
-        assert len(shared_items) == len(mapping)
+        assert mapping.items() <= catalog.items()
 
-    @given(mapping=dictionaries(keys=integers(), values=integers()))
+    @given(mapping=dictionaries(_INTS, _INTS, max_size=50))
+    @_INCREMENTAL_BUILD_SETTINGS
     def test_adding_items_puts_them_in_the_catalog(self, mapping):
         builder = CatalogBuilder()
         for key, value in mapping.items():
             builder.add(key, value)
         catalog = builder.create()
-        assert all(catalog[key] == value for key, value in mapping.items())
+        assert dict(catalog.items()) == mapping
 
     def test_irregular_mapping_gives_dictionary_catalog(self):
-        mapping = {
-            1: 2,
-            2: 3,
-            3: 5,
-            5: 7,
-            8: 11,
-            13: 13,
-            21: 17,
-            34: 19,
-            55: 23,
-            89: 29,
-            144: 31,
-        }
-        builder = CatalogBuilder(mapping)
+        builder = CatalogBuilder(_IRREGULAR_EXAMPLE)
         catalog = builder.create()
-        assert all(catalog[key] == value for key, value in mapping.items())
+        assert all(catalog[key] == value for key, value in _IRREGULAR_EXAMPLE.items())
 
 
 class TestLastIndexVariesQuickestCatalog2D:
 
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
+    @given(i_range=_RANGE,
+           j_range=_RANGE,
            data=data())
-    def test_i_range_preserved(self, i_range, j_range, data):
+    def test_row_major_invariants(self, i_range, j_range, data):
         num_indices = len(i_range) * len(j_range)
         v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
         catalog = LastIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
         assert catalog.i_range == i_range
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_j_range_preserved(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = LastIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
         assert catalog.j_range == j_range
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_v_range_preserved(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = LastIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
         assert catalog.v_range == v_range
+        i_max = i_range.stop - i_range.step
+        j_max = j_range.stop - j_range.step
+        assert catalog.i_min == i_range.start
+        assert catalog.i_max == i_max
+        assert catalog.j_min == j_range.start
+        assert catalog.j_max == j_max
+        assert catalog.key_min() == (i_range.start, j_range.start)
+        assert catalog.key_max() == (i_max, j_max)
+        assert catalog.value_first() == first(v_range)
+        assert catalog.value_last() == last(v_range)
+        r = repr(catalog)
+        assert r.startswith('LastIndexVariesQuickestCatalog2D')
+        assert 'i_range={!r}'.format(i_range) in r
+        assert 'j_range={!r}'.format(j_range) in r
+        assert 'v_range={!r}'.format(v_range) in r
+        assert check_balanced(r)
 
     @given(i_range=ranges(min_size=1, min_step_value=1),
            j_range=ranges(min_size=1, min_step_value=1),
@@ -243,106 +297,8 @@ class TestLastIndexVariesQuickestCatalog2D:
         catalog = LastIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
         assert all(a == b for a, b in zip(product(i_range, j_range), iter(catalog)))
 
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_i_min(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = LastIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.i_min == i_range.start
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_i_max(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = LastIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.i_max == i_range.stop - i_range.step
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_j_min(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = LastIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.j_min == j_range.start
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_j_max(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = LastIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.j_max == j_range.stop - j_range.step
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_key_min(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = LastIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.key_min() == (i_range.start, j_range.start)
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_key_max(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = LastIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.key_max() == (i_range.stop - i_range.step,
-                                     j_range.stop - j_range.step)
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_value_start(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = LastIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.value_first() == first(v_range)
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_value_stop(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = LastIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.value_last() == last(v_range)
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_repr(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = LastIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        r = repr(catalog)
-        assert r.startswith('LastIndexVariesQuickestCatalog2D')
-        assert 'i_range={!r}'.format(i_range) in r
-        assert 'j_range={!r}'.format(j_range) in r
-        assert 'v_range={!r}'.format(v_range) in r
-        assert check_balanced(r)
-
     def test_row_major_example(self):
-        d = {
-            (0, 4): 8,
-            (0, 5): 9,
-            (0, 6): 10,
-            (1, 4): 11,
-            (1, 5): 12,
-            (1, 6): 13,
-            (2, 4): 14,
-            (2, 5): 15,
-            (2, 6): 16
-        }
-        catalog_builder = CatalogBuilder(d)
+        catalog_builder = CatalogBuilder(_ROW_MAJOR_EXAMPLE)
         catalog = catalog_builder.create()
         assert isinstance(catalog, LastIndexVariesQuickestCatalog2D)
         assert catalog.key_min() == (0, 4)
@@ -358,7 +314,7 @@ class TestLastIndexVariesQuickestCatalog2D:
         with raises(KeyError):
             _ = catalog[(0, 0)]
 
-        assert all(d[key] == catalog[key] for key in d)
+        assert all(_ROW_MAJOR_EXAMPLE[key] == catalog[key] for key in _ROW_MAJOR_EXAMPLE)
 
     def test_complex_row_major_example(self):
         i_range = range(1, 31, 3)
@@ -398,6 +354,7 @@ class TestLastIndexVariesQuickestCatalog2D:
     @given(i_range=ranges(min_size=1, max_size=20, min_step_value=1),
            j_range=ranges(min_size=1, max_size=20, min_step_value=1),
            data=data())
+    @_QUADRATIC_SETTINGS
     def test_complex_general(self, i_range, j_range, data):
         num_indices = len(i_range) * len(j_range)
         v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
@@ -422,6 +379,7 @@ class TestLastIndexVariesQuickestCatalog2D:
     @given(i_range=ranges(min_size=2, max_size=20, min_step_value=1),
            j_range=ranges(min_size=2, max_size=20, min_step_value=1),
            data=data())
+    @_QUADRATIC_SETTINGS
     def test_complex_always_row_major_general(self, i_range, j_range, data):
         num_indices = len(i_range) * len(j_range)
         v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
@@ -446,6 +404,7 @@ class TestLastIndexVariesQuickestCatalog2D:
     @given(i_range=ranges(min_size=1, max_size=20, min_step_value=1),
            j_range=ranges(min_size=1, max_size=20, min_step_value=1),
            data=data())
+    @_QUADRATIC_SETTINGS
     def test_key(self, i_range, j_range, data):
         num_indices = len(i_range) * len(j_range)
         v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
@@ -467,32 +426,32 @@ class TestLastIndexVariesQuickestCatalog2D:
 
 class TestFirstIndexVariesQuickestCatalog2D:
 
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
+    @given(i_range=_RANGE,
+           j_range=_RANGE,
            data=data())
-    def test_i_range_preserved(self, i_range, j_range, data):
+    def test_column_major_invariants(self, i_range, j_range, data):
         num_indices = len(i_range) * len(j_range)
         v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
         catalog = FirstIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
         assert catalog.i_range == i_range
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_j_range_preserved(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = FirstIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
         assert catalog.j_range == j_range
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_v_range_preserved(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = FirstIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
         assert catalog.v_range == v_range
+        i_max = i_range.stop - i_range.step
+        j_max = j_range.stop - j_range.step
+        assert catalog.i_min == i_range.start
+        assert catalog.i_max == i_max
+        assert catalog.j_min == j_range.start
+        assert catalog.j_max == j_max
+        assert catalog.key_min() == (i_range.start, j_range.start)
+        assert catalog.key_max() == (i_max, j_max)
+        assert catalog.value_first() == first(v_range)
+        assert catalog.value_last() == last(v_range)
+        r = repr(catalog)
+        assert r.startswith('FirstIndexVariesQuickestCatalog2D')
+        assert 'i_range={!r}'.format(i_range) in r
+        assert 'j_range={!r}'.format(j_range) in r
+        assert 'v_range={!r}'.format(v_range) in r
+        assert check_balanced(r)
 
     @given(i_range=ranges(min_size=1, min_step_value=1),
            j_range=ranges(min_size=1, min_step_value=1),
@@ -555,106 +514,8 @@ class TestFirstIndexVariesQuickestCatalog2D:
         catalog = FirstIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
         assert all(a == b for a, b in zip(((i, j) for (j, i) in product(j_range, i_range)), iter(catalog)))
 
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_i_min(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = FirstIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.i_min == i_range.start
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_i_max(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = FirstIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.i_max == i_range.stop - i_range.step
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_j_min(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = FirstIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.j_min == j_range.start
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_j_max(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = FirstIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.j_max == j_range.stop - j_range.step
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_key_min(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = FirstIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.key_min() == (i_range.start, j_range.start)
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_key_max(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = FirstIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.key_max() == (i_range.stop - i_range.step,
-                                     j_range.stop - j_range.step)
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_value_start(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = FirstIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.value_first() == first(v_range)
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_value_stop(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = FirstIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        assert catalog.value_last() == last(v_range)
-
-    @given(i_range=ranges(min_size=1, min_step_value=1),
-           j_range=ranges(min_size=1, min_step_value=1),
-           data=data())
-    def test_repr(self, i_range, j_range, data):
-        num_indices = len(i_range) * len(j_range)
-        v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
-        catalog = FirstIndexVariesQuickestCatalog2D(i_range, j_range, v_range)
-        r = repr(catalog)
-        assert r.startswith('FirstIndexVariesQuickestCatalog2D')
-        assert 'i_range={!r}'.format(i_range) in r
-        assert 'j_range={!r}'.format(j_range) in r
-        assert 'v_range={!r}'.format(v_range) in r
-        assert check_balanced(r)
-
     def test_column_major_example(self):
-        d = {
-            (11, 14): 5,
-            (13, 14): 10,
-            (15, 14): 15,
-            (11, 16): 20,
-            (13, 16): 25,
-            (15, 16): 30,
-            (11, 18): 35,
-            (13, 18): 40,
-            (15, 18): 45
-        }
-        catalog_builder = CatalogBuilder(d)
+        catalog_builder = CatalogBuilder(_COLUMN_MAJOR_EXAMPLE)
         catalog = catalog_builder.create()
         assert isinstance(catalog, FirstIndexVariesQuickestCatalog2D)
         assert catalog.key_min() == (11, 14)
@@ -670,7 +531,7 @@ class TestFirstIndexVariesQuickestCatalog2D:
         with raises(KeyError):
             _ = catalog[(0, 0)]
 
-        assert all(d[key] == catalog[key] for key in d)
+        assert all(_COLUMN_MAJOR_EXAMPLE[key] == catalog[key] for key in _COLUMN_MAJOR_EXAMPLE)
 
     def test_complex_column_major_example(self):
         i_range = range(1, 31, 3)
@@ -713,6 +574,7 @@ class TestFirstIndexVariesQuickestCatalog2D:
     @given(i_range=ranges(min_size=1, max_size=20, min_step_value=1),
            j_range=ranges(min_size=1, max_size=20, min_step_value=1),
            data=data())
+    @_QUADRATIC_SETTINGS
     def test_complex_general(self, i_range, j_range, data):
         num_indices = len(i_range) * len(j_range)
         v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
@@ -737,6 +599,7 @@ class TestFirstIndexVariesQuickestCatalog2D:
     @given(i_range=ranges(min_size=2, max_size=20, min_step_value=1),
            j_range=ranges(min_size=2, max_size=20, min_step_value=1),
            data=data())
+    @_QUADRATIC_SETTINGS
     def test_complex_always_column_major_general(self, i_range, j_range, data):
         num_indices = len(i_range) * len(j_range)
         v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
@@ -761,6 +624,7 @@ class TestFirstIndexVariesQuickestCatalog2D:
     @given(i_range=ranges(min_size=1, max_size=20, min_step_value=1),
            j_range=ranges(min_size=1, max_size=20, min_step_value=1),
            data=data())
+    @_QUADRATIC_SETTINGS
     def test_key(self, i_range, j_range, data):
         num_indices = len(i_range) * len(j_range)
         v_range = data.draw(ranges(min_size=num_indices, max_size=num_indices))
@@ -781,22 +645,14 @@ class TestFirstIndexVariesQuickestCatalog2D:
 
 class TestDictionaryCatalog:
 
-    @given(dictionaries(integers(), integers()))
-    def test_items_keys_are_present(self, items):
+    @given(_INT_DICT)
+    def test_dictionary_catalog_invariants(self, items):
         catalog = DictionaryCatalog(items)
         assert all(key in catalog for key in items.keys())
-
-    @given(dictionaries(integers(), integers()))
-    def test_items_keys_are_preserved(self, items):
-        catalog = DictionaryCatalog(items)
         assert all(catalog[key] == value for key, value in items.items())
-
-    @given(dictionaries(integers(), integers()))
-    def test_length(self, items):
-        catalog = DictionaryCatalog(items)
         assert len(catalog) == len(items)
 
-    @given(dictionaries(integers(min_value=0, max_value=100), integers(min_value=0, max_value=100)))
+    @given(_BOUNDED_DICT)
     def test_repr(self, items):
         catalog = DictionaryCatalog(items)
         r = repr(catalog)
@@ -821,33 +677,34 @@ class TestDictionaryCatalog2D:
         catalog = DictionaryCatalog2D(items.i_range, items.j_range, items.items)
         assert catalog.j_range == items.j_range
 
-    @given(i_range=lists(integers(), min_size=2),
-           j_range=ranges(min_size=1, max_size=100, min_step_value=1),
-           items=dictionaries(integers(min_value=0, max_value=100), integers(min_value=0, max_value=100)))
+    @given(i_range=unsorted_lists(max_size=20),
+           j_range=_RANGE,
+           items=_BOUNDED_DICT)
     def test_unsorted_irange_raises_value_error(self, i_range, j_range, items):
-        assume(not is_sorted(i_range))
         with raises(ValueError):
             DictionaryCatalog2D(i_range, j_range, items)
 
-    @given(i_range=ranges(min_size=1, max_size=100, min_step_value=1),
-           j_range=lists(integers(), min_size=2),
-           items=dictionaries(integers(min_value=0, max_value=100), integers(min_value=0, max_value=100)))
+    @given(i_range=_RANGE,
+           j_range=unsorted_lists(max_size=20),
+           items=_BOUNDED_DICT)
     def test_unsorted_jrange_raises_value_error(self, i_range, j_range, items):
-        assume(not is_sorted(j_range))
         with raises(ValueError):
             DictionaryCatalog2D(i_range, j_range, items)
 
     @given(items2d(10, 10))
+    @_QUADRATIC_SETTINGS
     def test_length(self, items):
         catalog = DictionaryCatalog2D(items.i_range, items.j_range, items.items)
         assert len(catalog) == len(items.items)
 
     @given(items2d(10, 10))
+    @_QUADRATIC_SETTINGS
     def test_containment(self, items):
         catalog = DictionaryCatalog2D(items.i_range, items.j_range, items.items)
         assert all(k in catalog for k in items.items.keys())
 
     @given(items2d(10, 10))
+    @_QUADRATIC_SETTINGS
     def test_repr(self, items):
         catalog = DictionaryCatalog2D(items.i_range, items.j_range, items.items)
         r = repr(catalog)
@@ -879,49 +736,46 @@ class TestRegularConstantCatalog:
         with raises(ValueError):
             RegularConstantCatalog(0, 10, 3, 0)
 
-    @given(r=ranges(min_size=1, max_size=100, min_step_value=1),
-           c=integers(),
-           k=integers())
+    @given(r=_RANGE,
+           c=_INTS,
+           k=_INTS)
     def test_missing_key_raises_key_error(self, r, c, k):
         assume(k not in r)
         catalog = RegularConstantCatalog(r.start, r[-1], r.step, c)
         with raises(KeyError):
             catalog[k]
 
-    @given(r=ranges(min_size=1, max_size=100, min_step_value=1),
-           c=integers())
+    @given(r=_RANGE,
+           c=_INTS)
     def test_mapping_is_preserved(self, r, c):
         catalog = RegularConstantCatalog(r.start, r[-1], r.step, c)
         assert all(catalog[key] == c for key in r)
 
-    @given(r=ranges(min_size=1, max_size=100, min_step_value=1),
-           c=integers())
+    @given(r=_RANGE,
+           c=_INTS)
     def test_length(self, r, c):
         catalog = RegularConstantCatalog(r.start, r[-1], r.step, c)
         assert len(catalog) == len(r)
 
-    @given(r=ranges(min_size=1, max_size=100, min_step_value=1),
-           c=integers())
+    @given(r=_RANGE,
+           c=_INTS)
     def test_containment(self, r, c):
         catalog = RegularConstantCatalog(r.start, r[-1], r.step, c)
         assert all(key in catalog for key in r)
 
-    @given(r=ranges(min_size=1, max_size=100, min_step_value=1),
-           c=integers())
+    @given(r=_RANGE,
+           c=_INTS)
     def test_iteration(self, r, c):
         catalog = RegularConstantCatalog(r.start, r[-1], r.step, c)
         assert all(k == m for k, m in zip(iter(catalog), r))
 
-    @given(r=ranges(min_size=1, max_size=100, min_step_value=1),
-           c=integers())
+    @given(r=_RANGE,
+           c=_INTS)
     def test_repr(self, r, c):
         catalog = RegularConstantCatalog(r.start, r[-1], r.step, c)
-        r = repr(catalog)
-        assert r.startswith('RegularConstantCatalog')
-        assert 'key_min={}'.format(catalog._key_min) in r
-        assert 'key_max={}'.format(catalog._key_max) in r
-        assert 'key_stride={}'.format(catalog._key_stride) in r
-        assert check_balanced(r)
+        m = _REGULAR_CONSTANT_CATALOG_REPR.fullmatch(repr(catalog))
+        assert m is not None
+        assert tuple(map(int, m.groups())) == (catalog._key_min, catalog._key_max, catalog._key_stride, c)
 
 
 class TestConstantCatalog:
@@ -937,33 +791,12 @@ class TestConstantCatalog:
 
     @given(keys=lists(integers()),
            value=integers())
-    def test_mapping_is_preserved(self, keys, value):
+    def test_constant_catalog_invariants(self, keys, value):
         catalog = ConstantCatalog(keys, value)
         assert all(catalog[key] == value for key in keys)
-
-    @given(keys=sets(integers()),
-           value=integers())
-    def test_length(self, keys, value):
-        catalog = ConstantCatalog(keys, value)
-        assert len(catalog) == len(keys)
-
-    @given(keys=lists(integers()),
-           value=integers())
-    def test_containment(self, keys, value):
-        catalog = ConstantCatalog(keys, value)
+        assert len(catalog) == len(set(keys))
         assert all(key in catalog for key in keys)
-
-    @given(keys=lists(integers()),
-           value=integers())
-    def test_iteration(self, keys, value):
-        s = SortedFrozenSet(keys)
-        catalog = ConstantCatalog(keys, value)
-        assert all(k == m for k, m in zip(iter(catalog), s))
-
-    @given(keys=lists(integers()),
-           value=integers())
-    def test_repr(self, keys, value):
-        catalog = ConstantCatalog(keys, value)
+        assert list(catalog) == sorted(set(keys))
         r = repr(catalog)
         assert r.startswith('ConstantCatalog')
         assert 'keys=[{} items]'.format(len(catalog._keys)) in r
@@ -981,19 +814,22 @@ class TestRegularCatalog:
         with raises(ValueError):
             RegularCatalog(0, 10, 3, [0])
 
-    @given(r=ranges(min_size=1, max_size=100, min_step_value=1),
-           d=data())
-    def test_mismatched_values_length_raises_value_error(self, r, d):
-        values = d.draw(lists(integers()))
-        assume(len(values) != len(r))
+    @pytest.mark.parametrize("values", [
+        [],
+        [1],
+        [1, 2, 3],
+        [1, 2, 3, 4, 5],
+        [1, 2, 3, 4, 5, 6, 7],
+        [1] * 10,
+    ])
+    def test_mismatched_values_length_raises_value_error(self, values):
         with raises(ValueError):
-            RegularCatalog(r.start, r[-1], r.step, values)
+            RegularCatalog(0, 10, 2, values)
 
-    @given(r=ranges(min_size=1, max_size=100, min_step_value=1),
-           d=data())
-    def test_missing_key_raises_key_error(self, r, d):
-        values = d.draw(lists(integers(), min_size=len(r), max_size=len(r)))
-        k = d.draw(integers())
+    @given(rv=ranges_with_values(),
+           k=_INTS)
+    def test_missing_key_raises_key_error(self, rv, k):
+        r, values = rv
         assume(k not in r)
         catalog = RegularCatalog(r.start, r[-1], r.step, values)
         with raises(KeyError):
@@ -1004,46 +840,38 @@ class TestRegularCatalog:
         with raises(KeyError):
             catalog[1]
 
-    @given(r=ranges(min_size=1, max_size=100, min_step_value=1),
-           d=data())
-    def test_mapping_is_preserved(self, r, d):
-        values = d.draw(lists(integers(), min_size=len(r), max_size=len(r)))
+    @given(rv=ranges_with_values())
+    def test_mapping_is_preserved(self, rv):
+        r, values = rv
         catalog = RegularCatalog(r.start, r[-1], r.step, values)
         assert all(catalog[k] == v for k, v in zip(r, values))
 
-    @given(r=ranges(min_size=1, max_size=100, min_step_value=1),
-           d=data())
-    def test_length(self, r, d):
-        values = d.draw(lists(integers(), min_size=len(r), max_size=len(r)))
+    @given(rv=ranges_with_values())
+    def test_length(self, rv):
+        r, values = rv
         catalog = RegularCatalog(r.start, r[-1], r.step, values)
         assert len(catalog) == len(r)
 
-    @given(r=ranges(min_size=1, max_size=100, min_step_value=1),
-           d=data())
-    def test_containment(self, r, d):
-        values = d.draw(lists(integers(), min_size=len(r), max_size=len(r)))
+    @given(rv=ranges_with_values())
+    def test_containment(self, rv):
+        r, values = rv
         catalog = RegularCatalog(r.start, r[-1], r.step, values)
         assert all(key in catalog for key in r)
 
-    @given(r=ranges(min_size=1, max_size=100, min_step_value=1),
-           d=data())
-    def test_iteration(self, r, d):
-        values = d.draw(lists(integers(), min_size=len(r), max_size=len(r)))
+    @given(rv=ranges_with_values())
+    def test_iteration(self, rv):
+        r, values = rv
         catalog = RegularCatalog(r.start, r[-1], r.step, values)
         assert all(k == m for k, m in zip(iter(catalog), r))
 
-    @given(r=ranges(min_size=1, max_size=100, min_step_value=1),
-           d=data())
-    def test_repr(self, r, d):
-        values = d.draw(lists(integers(), min_size=len(r), max_size=len(r)))
+    @given(rv=ranges_with_values())
+    def test_repr(self, rv):
+        r, values = rv
         catalog = RegularCatalog(r.start, r[-1], r.step, values)
-        r = repr(catalog)
-        assert r.startswith('RegularCatalog')
-        assert 'key_min={}'.format(catalog._key_min) in r
-        assert 'key_max={}'.format(catalog._key_max) in r
-        assert 'key_stride={}'.format(catalog._key_stride) in r
-        assert 'values=[{} items]'.format(len(catalog._values)) in r
-        assert check_balanced(r)
+        m = _REGULAR_CATALOG_REPR.fullmatch(repr(catalog))
+        assert m is not None
+        assert tuple(map(int, m.groups())) == (catalog._key_min, catalog._key_max, catalog._key_stride,
+                                               len(catalog._values))
 
 
 class TestLinearRegularCatalog: